@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
 import rich_click as click
 
-from deva._version import __version__
+from deva._version import __version__, __version_tuple__
 from deva.cli.base import dynamic_group
 from deva.config.constants import AppEnvVars, ConfigEnvVars
 
+if TYPE_CHECKING:
+    from deva.utils.fs import Path
+
 
 @dynamic_group(
     context_settings={"help_option_names": ["-h", "--help"], "max_content_width": 120, "show_default": True},
@@ -150,14 +154,10 @@ def deva(
         app.output(ctx.get_help())
         app.abort(code=0)
 
-    cwd = Path.cwd()
-    if (version_file := cwd / ".deva-version").is_file() or (version_file := cwd / ".deva" / "version").is_file():
-        pinned_version = version_file.read_text().strip()
-        pinned_version_parts = list(map(int, pinned_version.split(".")))
+    if (pinned_version := _read_pinned_version(Path.cwd())) is not None:
+        pinned_version_parts = tuple(map(int, pinned_version.split(".")))
         # Limit to X.Y.Z in case of dev versions e.g. 1.2.3.dev1
-        current_version_parts = list(map(int, __version__.split(".")[:3]))
-
-        if current_version_parts < pinned_version_parts:
+        if __version_tuple__[:3] < pinned_version_parts:
             app.display_critical(
                 f"Repo requires at least deva version {pinned_version} but {__version__} is installed."
             )
@@ -170,6 +170,16 @@ def deva(
     ctx.obj = app
 
 
+def _read_pinned_version(root: Path) -> str | None:
+    for version_file in (root / ".deva-version", root / ".deva" / "version"):
+        try:
+            return version_file.read_text().strip()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            continue
+
+    return None
+
+
 def main() -> None:
     try:
         deva(prog_name="deva", windows_expand_args=False)
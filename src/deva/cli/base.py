@@ -70,6 +70,8 @@ class DynamicGroup(click.RichGroup):
         self._external_plugins = external_plugins
         # e.g. ('dev', 'runtime', 'qa')
         self._subcommands = subcommands
+        # Lazily loaded subcommands and external plugins, resolved at most once
+        self.__resolved_commands: dict[str, click.Command] = {}
 
     @property
     def _module(self) -> str:
@@ -79,12 +81,14 @@ class DynamicGroup(click.RichGroup):
     @cached_property
     def _plugins(self) -> dict[str, str]:
         import os
+        import re
 
         import find_exe
 
         plugin_prefix = self.callback.__module__.replace("deva.cli", "deva", 1).replace(".", "-")
         plugin_prefix = f"{plugin_prefix}-"
-        exe_pattern = f"^{plugin_prefix}[^-]+$"
+        # Compile once rather than having every entry on every `PATH` directory resolve the pattern
+        exe_pattern = re.compile(f"^{re.escape(plugin_prefix)}[^-]+$")
 
         plugins: dict[str, str] = {}
         for executable in find_exe.with_pattern(exe_pattern):
@@ -118,13 +122,18 @@ class DynamicGroup(click.RichGroup):
         # https://click.palletsprojects.com/en/8.1.x/api/#click.Context.meta
         ctx.meta[self._create_module_meta_key(self._module)] = self._external_plugins_allowed(ctx)
 
-        if cmd_name in self._subcommands:
-            return self._lazy_load(cmd_name)
+        if cmd_name in self.__resolved_commands:
+            return self.__resolved_commands[cmd_name]
 
-        if cmd_name in self._plugins:
-            return _get_external_plugin_callback(cmd_name, self._plugins[cmd_name])
+        if cmd_name in self._subcommands:
+            command = self._lazy_load(cmd_name)
+        elif cmd_name in self._plugins:
+            command = _get_external_plugin_callback(cmd_name, self._plugins[cmd_name])
+        else:
+            return super().get_command(ctx, cmd_name)
 
-        return super().get_command(ctx, cmd_name)
+        self.__resolved_commands[cmd_name] = command
+        return command
 
     def _lazy_load(self, cmd_name: str) -> click.Command:
         import_path = f"{self._module}.{cmd_name}"
@@ -198,8 +207,8 @@ def ensure_features_installed(
     with temp_directory() as temp_dir:
         data_dir = Path(sysconfig.get_path("data")) / "deva-data"
         for filename in ("uv.lock", "pyproject.toml"):
-            data_file = data_dir / filename
-            shutil.copy(data_file, temp_dir)
+            # Only the contents are needed, skip copying permission bits
+            shutil.copyfile(data_dir / filename, temp_dir / filename)
 
         env_vars = EnvVars()
         # https://docs.astral.sh/uv/concepts/projects/config/#project-environment-path
@@ -19,7 +19,7 @@ def cmd(app: Application) -> None:
     """
     List the available developer environments.
     """
-    import json
+    import msgspec
 
     from deva.env.dev import get_dev_env
 
@@ -39,7 +39,7 @@ def cmd(app: Application) -> None:
                 env_status = env.status()
                 instance_data[instance_name] = {
                     "State": env_status.state,
-                    "Config": json.loads(env.config_file.read_text()),
+                    "Config": msgspec.json.decode(env.config_file.read_bytes()),
                 }
 
         if instance_data:
@@ -41,7 +41,7 @@ class Path(pathlib.Path):
         if sys.platform == "win32" or sys.platform == "darwin":
             path = path.casefold()
 
-        digest = sha256(path.encode("utf-8")).digest()
+        digest = sha256(path.encode("utf-8"), usedforsecurity=False).digest()
         return urlsafe_b64encode(digest).decode("utf-8")
 
     @cached_property
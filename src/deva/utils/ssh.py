@@ -38,7 +38,7 @@ def derive_dynamic_ssh_port(key: str) -> int:
     min_port = 49152
     max_port = 65535
 
-    repo_id = int.from_bytes(sha256(key.encode("utf-8")).digest(), "big")
+    repo_id = int.from_bytes(sha256(key.encode("utf-8"), usedforsecurity=False).digest(), "big")
     return repo_id % (max_port - min_port) + min_port
 
 
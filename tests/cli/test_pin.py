@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import pytest
 
-from deva._version import __version__
+from deva._version import __version__, __version_tuple__
 
 
 @pytest.fixture(scope="module")
@@ -48,3 +48,14 @@ class TestVersionMismatch:
             deva self update
             """
         )
+
+
+def test_version_satisfied(deva, config_file, temp_dir):
+    version_file = temp_dir / ".deva-version"
+    with temp_dir.as_cwd():
+        version_file.write_text(".".join(map(str, __version_tuple__[:3])))
+
+        result = deva("config", "find")
+
+    assert result.exit_code == 0, result.output
+    assert result.output == f"{config_file.path}\n"